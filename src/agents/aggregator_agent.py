@@ -1,62 +1,28 @@
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import Any, List
+
+try:
+    import orjson  # optional: C-level JSON serialization for large reports
+except Exception:
+    orjson = None
 
 
 class Synthesis_Agent:
-    """Compiles the final report from validated pain points.
+    """Synthesis agent that compiles validated pain points into a report.
 
-    The agent accepts a list of validated pain point dicts with at least
-    'quote', 'source', and 'timestamp' keys (timestamp may be a datetime).
-    It returns a formatted Markdown string by default.
+    Tests provide a simple list of strings (quotes). In production the
+    analyzer may return dicts with metadata ('quote'/'pain_point',
+    'source', 'timestamp'). Both formats are supported, and the report can
+    be rendered as plain text (default) or JSON via `output_format`.
     """
 
-    def __init__(self, output_format: str = "markdown"):
-        self.output_format = output_format
-
-    def compile_report(self, validated_pain_points: List[Dict[str, Any]]) -> str:
-        """Return a report as a string. Supported formats: 'markdown', 'json'."""
-        if self.output_format == "json":
-            import json
-
-            # Ensure timestamps are serializable
-            cleaned = []
-            for p in validated_pain_points:
-                cp = dict(p)
-                ts = cp.get('timestamp')
-                if isinstance(ts, datetime):
-                    cp['timestamp'] = ts.isoformat()
-                cleaned.append(cp)
-            return json.dumps({'pain_points': cleaned}, indent=2)
+    __slots__ = ("output_format", "report")
 
-        # Default: markdown
-        lines = ["# Pain Points Report", ""]
-        if not validated_pain_points:
-            lines.append("No validated pain points found.")
-            return "\n".join(lines)
-
-        for i, p in enumerate(validated_pain_points, start=1):
-            quote = p.get('quote')
-            source = p.get('source', 'unknown')
-            ts = p.get('timestamp')
-            if isinstance(ts, datetime):
-                ts = ts.date().isoformat()
-            lines.append(f"{i}. \"{quote}\"")
-            lines.append(f"   - Source: {source}")
-            if ts:
-                lines.append(f"   - Date: {ts}")
-            lines.append("")
-
-        return "\n".join(lines)
-class Synthesis_Agent:
-    """Synthesis agent that compiles validated pain points into a human-readable report.
-
-    Tests provide a simple list of strings (quotes). In production the analyzer may
-    return dicts with metadata. This class supports both formats.
-    """
-    def __init__(self):
+    def __init__(self, output_format: str = "text"):
+        self.output_format = output_format
         self.report = ""
 
-    def compile_report(self, validated_pain_points):
+    def compile_report(self, validated_pain_points: List[Any]) -> str:
         # Accept either a list of strings or a list of dicts
         formatted_points = []
         for p in validated_pain_points:
@@ -80,9 +46,32 @@ class Synthesis_Agent:
                     'timestamp': None
                 })
 
-        self.report = self._render_report(formatted_points)
+        if self.output_format == "json":
+            self.report = self._render_json(formatted_points)
+        else:
+            self.report = self._render_report(formatted_points)
         return self.report
 
+    def _render_json(self, formatted_points):
+        import json
+
+        # Ensure timestamps are serializable. Only shallow-copy the rows
+        # that actually hold a datetime; `default=str` lets json handle
+        # any stray non-serializable values in C without per-row work.
+        if any(isinstance(p.get('timestamp'), datetime) for p in formatted_points):
+            cleaned = [
+                {**p, 'timestamp': p['timestamp'].isoformat()}
+                if isinstance(p.get('timestamp'), datetime) else p
+                for p in formatted_points
+            ]
+        else:
+            cleaned = formatted_points
+        if orjson is not None:
+            return orjson.dumps({'pain_points': cleaned},
+                                option=orjson.OPT_INDENT_2,
+                                default=str).decode()
+        return json.dumps({'pain_points': cleaned}, indent=2, default=str)
+
     def _render_report(self, formatted_points):
         lines = ["Pain Points Report", "===================", ""]
         for i, item in enumerate(formatted_points, start=1):
@@ -91,4 +80,4 @@ class Synthesis_Agent:
             if item.get('timestamp'):
                 lines.append(f"   Date: {item['timestamp']}")
             lines.append("")
-        return "\n".join(lines)
\ No newline at end of file
+        return "\n".join(lines)
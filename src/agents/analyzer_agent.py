@@ -1,7 +1,29 @@
 import re
+from collections import Counter
 from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Any
 
+# Token pattern for the fallback clustering path, compiled once at import.
+# Anchored on a letter so pure-number runs don't form clustering tokens.
+_TOKEN_RE = re.compile(r"[A-Za-z][A-Za-z0-9_]{3,}")
+
+# Timestamp formats tried when pandas is unavailable or returns NaT.
+_TS_FORMATS = ("%Y-%m-%dT%H:%M:%SZ", "%Y-%m-%d", "%d %b %Y")
+
+# Cached sklearn classes so repeated _cluster_quotes calls don't pay the
+# import machinery each time. Populated lazily on first use.
+_SKLEARN_CLASSES = None
+
+
+def _sklearn_clusterers():
+    global _SKLEARN_CLASSES
+    if _SKLEARN_CLASSES is None:
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        from sklearn.cluster import MiniBatchKMeans
+
+        _SKLEARN_CLASSES = (TfidfVectorizer, MiniBatchKMeans)
+    return _SKLEARN_CLASSES
+
 
 class Validation_Agent:
     """Validation agent that filters raw_results into validated pain points.
@@ -11,6 +33,9 @@ class Validation_Agent:
     instance with short notes for upstream agents.
     """
 
+    __slots__ = ("max_age_months", "_max_age", "feedback_log",
+                 "_frustration_re", "validated_details")
+
     DEFAULT_MAX_AGE_MONTHS = 24
 
     # simple frustration patterns
@@ -29,7 +54,14 @@ class Validation_Agent:
 
     def __init__(self, max_age_months: int = None):
         self.max_age_months = max_age_months or self.DEFAULT_MAX_AGE_MONTHS
+        # max_age never changes after construction; compute the timedelta once
+        self._max_age = timedelta(days=int(self.max_age_months * 30))
         self.feedback_log: List[str] = []
+        # Combine all patterns into one alternation compiled once, so each
+        # quote is scanned with a single regex call instead of one per pattern.
+        self._frustration_re = re.compile(
+            "|".join(f"(?:{p})" for p in self.FRUSTRATION_PATTERNS), re.IGNORECASE
+        )
 
     def validate_results(self, raw_results: List[Any]) -> List[str]:
         """Validate and cluster raw results.
@@ -37,60 +69,126 @@ class Validation_Agent:
         Returns a list of dicts: {quote, source, url, timestamp, cluster}
         """
         self.feedback_log = []
-        normalized = []
 
+        # One clock read for the whole batch instead of per-entry calls
+        now = datetime.now(timezone.utc)
+        max_age = self._max_age
+
+        # Deduplicate by quote up front (first occurrence wins) so the regex
+        # filter and clustering only ever see unique snippets — scraper
+        # output commonly repeats the same text across queries.
+        unique: Dict[str, Any] = {}
         for item in raw_results:
-            entry = self._normalize(item)
-            if not entry:
-                continue
-            if not self._passes_recency(entry):
-                # record feedback for upstream query refinement
-                self.feedback_log.append(f"Dropped outdated: {entry.get('timestamp')} -> {entry.get('quote')[:60]}")
-                continue
-            if not self._is_frustration(entry.get('quote', '')):
+            quote = self._extract_quote(item)
+            if quote:
+                unique.setdefault(quote, item)
+
+        # Filter early: the combined frustration regex is the most selective
+        # step, so run it before any timestamp work.
+        frustrated = []
+        for quote, item in unique.items():
+            if self._frustration_re.search(quote):
+                frustrated.append((quote, item))
+            else:
                 # non-frustration: ignore but keep note
-                self.feedback_log.append(f"Filtered neutral: {entry.get('quote')[:60]}")
+                self.feedback_log.append(f"Filtered neutral: {quote[:60]}")
+
+        # Parse the surviving timestamps in one vectorized pass — pandas'
+        # per-call overhead dwarfs its batch path, so one to_datetime over
+        # the whole batch beats N scalar calls.
+        raw_ts = [
+            item.get('timestamp') or item.get('date') or item.get('created_at')
+            if isinstance(item, dict) else None
+            for _, item in frustrated
+        ]
+        parsed_ts = self._parse_timestamps(raw_ts)
+
+        normalized = []
+        for (quote, item), ts in zip(frustrated, parsed_ts):
+            entry = self._normalize(item, ts)
+            if not self._passes_recency(entry, now, max_age):
+                # record feedback for upstream query refinement
+                self.feedback_log.append(f"Dropped outdated: {entry.get('timestamp')} -> {quote[:60]}")
                 continue
             normalized.append(entry)
 
-        # attempt clustering
-        clusters = self._cluster_quotes([e['quote'] for e in normalized])
+        # attempt clustering (on the lowercased view cached by _normalize)
+        clusters = self._cluster_quotes([e['_quote_lower'] for e in normalized])
         for e, c in zip(normalized, clusters):
             e['cluster'] = c
 
-        # Collate validated pain points (deduplicated by quote)
-        seen = set()
-        validated = []
-        for e in normalized:
-            q = e['quote']
-            if q in seen:
-                continue
-            seen.add(q)
-            validated.append(e)
-
         # store detailed records and return simplified list of quote strings for backwards compatibility
-        self.validated_details = validated
-        return [e['quote'] for e in validated]
+        self.validated_details = normalized
+        return [e['quote'] for e in normalized]
+
+    def _extract_quote(self, item: Any) -> Any:
+        # Pull the quote text out of a raw item without any other work
+        if isinstance(item, str):
+            return item
+        if isinstance(item, dict):
+            return item.get('text') or item.get('snippet') or item.get('quote') or item.get('content')
+        return None
 
-    def _normalize(self, item: Any) -> Dict[str, Any]:
-        # Accept either raw string or dicts
+    def _normalize(self, item: Any, parsed_ts: Any = None) -> Dict[str, Any]:
+        # Accept either raw string or dicts. `parsed_ts` carries the
+        # pre-parsed timestamp from the batched pass; parse lazily if absent.
         if isinstance(item, str):
-            return {'quote': item, 'source': 'unknown', 'url': None, 'timestamp': datetime.now(timezone.utc)}
+            return {'quote': item, '_quote_lower': item.lower(), 'source': 'unknown', 'url': None,
+                    'timestamp': parsed_ts or datetime.now(timezone.utc)}
         if isinstance(item, dict):
             quote = item.get('text') or item.get('snippet') or item.get('quote') or item.get('content')
             if not quote:
                 return None
-            # Parse timestamp if present
-            ts = item.get('timestamp') or item.get('date') or item.get('created_at')
-            parsed = self._parse_timestamp(ts)
-            return {'quote': quote, 'source': item.get('source', 'unknown'), 'url': item.get('url'), 'timestamp': parsed}
+            if parsed_ts is None:
+                ts = item.get('timestamp') or item.get('date') or item.get('created_at')
+                parsed_ts = self._parse_timestamp(ts)
+            # Cache the lowercased form once so downstream steps (clustering,
+            # token extraction) don't re-lowercase the same quote.
+            return {'quote': quote, '_quote_lower': quote.lower(), 'source': item.get('source', 'unknown'),
+                    'url': item.get('url'), 'timestamp': parsed_ts}
         return None
 
+    def _parse_timestamps(self, ts_list: List[Any]) -> List[Any]:
+        """Parse a batch of raw timestamps with one pandas call.
+
+        Rows pandas can't handle (or every row when pandas is absent) fall
+        back to the scalar `_parse_timestamp` path.
+        """
+        if not ts_list:
+            return []
+        now = datetime.now(timezone.utc)
+        try:
+            import pandas as pd
+
+            parsed = pd.to_datetime(ts_list, utc=True, errors='coerce')
+        except Exception:
+            return [self._parse_timestamp(ts) if ts else now for ts in ts_list]
+        out = []
+        for raw, p in zip(ts_list, parsed):
+            if pd.isna(p):
+                out.append(self._parse_timestamp(raw) if raw else now)
+                continue
+            dt = p.to_pydatetime()
+            if dt.tzinfo is None:
+                dt = dt.replace(tzinfo=timezone.utc)
+            out.append(dt)
+        return out
+
     def _parse_timestamp(self, ts) -> Any:
         # Try to parse timestamps from common formats. Use pandas if available,
         # otherwise try common patterns and fallback to now.
         if not ts:
             return datetime.now(timezone.utc)
+        if isinstance(ts, str):
+            # Fast path: the scraper itself emits ISO-8601 (isoformat + 'Z'),
+            # and fromisoformat is ~10x faster than strptime.
+            try:
+                dt = datetime.fromisoformat(ts.rstrip('Z'))
+                if dt.tzinfo is None:
+                    dt = dt.replace(tzinfo=timezone.utc)
+                return dt
+            except ValueError:
+                pass
         try:
             # try pandas parser if available
             import pandas as pd
@@ -105,7 +203,7 @@ class Validation_Agent:
             return dt
         except Exception:
             # naive fallback
-            for fmt in ("%Y-%m-%dT%H:%M:%SZ", "%Y-%m-%d", "%d %b %Y"):
+            for fmt in _TS_FORMATS:
                 try:
                     dt = datetime.strptime(str(ts), fmt)
                     return dt.replace(tzinfo=timezone.utc)
@@ -113,55 +211,65 @@ class Validation_Agent:
                     continue
             return datetime.now(timezone.utc)
 
-    def _passes_recency(self, entry: Dict[str, Any]) -> bool:
-        now = datetime.now(timezone.utc)
+    def _passes_recency(self, entry: Dict[str, Any], now: datetime = None,
+                        max_age: timedelta = None) -> bool:
+        if now is None:
+            now = datetime.now(timezone.utc)
+        if max_age is None:
+            max_age = self._max_age
         ts = entry.get('timestamp') or now
         # Normalize ts to tz-aware UTC
         if getattr(ts, 'tzinfo', None) is None:
             ts = ts.replace(tzinfo=timezone.utc)
-        age = now - ts
-        max_age = timedelta(days=int(self.max_age_months * 30))
-        return age <= max_age
+        return now - ts <= max_age
 
     def _is_frustration(self, text: str) -> bool:
-        txt = text.lower()
-        for pat in self.FRUSTRATION_PATTERNS:
-            if re.search(pat, txt):
-                return True
-        return False
+        return self._frustration_re.search(text) is not None
 
     def _cluster_quotes(self, quotes: List[str]) -> List[int]:
         """Attempt to cluster quotes into integer cluster ids.
 
-        Prefer sklearn's TF-IDF + KMeans if available. If not, do a simple
-        keyword-overlap clustering.
+        Callers pass quotes already lowercased. Prefer sklearn's TF-IDF +
+        KMeans if available. If not, do a simple keyword-overlap clustering.
         """
         if not quotes:
             return []
         try:
-            from sklearn.feature_extraction.text import TfidfVectorizer
-            from sklearn.cluster import KMeans
-            vec = TfidfVectorizer(stop_words='english')
+            TfidfVectorizer, MiniBatchKMeans = _sklearn_clusterers()
+            # l2-normalize at vectorization time so k-means distances reduce
+            # to sparse dot products; keep X sparse (no .toarray()).
+            vec = TfidfVectorizer(stop_words='english', norm='l2', sublinear_tf=True)
             X = vec.fit_transform(quotes)
             n_clusters = min(5, max(1, len(quotes) // 3))
-            km = KMeans(n_clusters=n_clusters, random_state=42)
+            km = MiniBatchKMeans(
+                n_clusters=n_clusters,
+                random_state=42,
+                batch_size=min(256, len(quotes)),
+                n_init=3,
+            )
             labels = km.fit_predict(X)
             return [int(l) for l in labels]
         except Exception:
-            # Simple overlap-based clustering: cluster by most frequent keyword
+            # Simple overlap-based clustering via an inverted token index:
+            # each token remembers which bucket it was first seen in, and a
+            # quote joins the bucket most of its tokens vote for. This is a
+            # single O(n*k) pass instead of comparing every quote against
+            # every existing bucket.
             clusters = []
-            buckets = []
+            buckets: List[set] = []
+            token_to_bucket: Dict[str, int] = {}
             for q in quotes:
-                tokens = set(re.findall(r"\w{4,}", q.lower()))
-                assigned = False
-                for i, b in enumerate(buckets):
-                    # if share tokens, same cluster
-                    if tokens & b:
-                        clusters.append(i)
-                        b.update(tokens)
-                        assigned = True
-                        break
-                if not assigned:
+                tokens = set(_TOKEN_RE.findall(q))
+                votes = Counter(
+                    token_to_bucket[t] for t in tokens if t in token_to_bucket
+                )
+                if votes:
+                    bucket_id = votes.most_common(1)[0][0]
+                    buckets[bucket_id].update(tokens)
+                else:
+                    bucket_id = len(buckets)
                     buckets.append(set(tokens))
-                    clusters.append(len(buckets) - 1)
+                for t in tokens:
+                    token_to_bucket.setdefault(t, bucket_id)
+                clusters.append(bucket_id)
             return clusters
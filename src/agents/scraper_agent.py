@@ -1,5 +1,12 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any
 
+# Dedup map for snippet strings: identical text frequently recurs across
+# queries (deterministic mocks, popular results), so share one string
+# object instead of carrying N copies downstream.
+_intern: Dict[str, str] = {}
+
 
 class Search_and_Retrieval_Agent:
     """A tool-using agent that executes queries against available search tools.
@@ -8,7 +15,10 @@ class Search_and_Retrieval_Agent:
     If external tools are not configured, it returns deterministic mock results
     so the system remains testable offline.
     """
-    def __init__(self, tools: Dict[str, Any] = None):
+
+    __slots__ = ("tools",)
+
+    def __init__(self, tools: Dict[str, Any] = None, session: Any = None):
         # Lazy import to avoid hard dependency when not used
         try:
             from src.agents.search_agent import TavilySearchAgent
@@ -16,31 +26,86 @@ class Search_and_Retrieval_Agent:
             TavilySearchAgent = None
 
         self.tools = tools or {}
-        # If no tavily provided in tools, instantiate one if possible
+        # If no tavily provided in tools, instantiate one if possible.
+        # `session` lets an owner (e.g. Workflow) share one connection pool
+        # across every query this agent will ever run.
         if 'tavily' not in self.tools and TavilySearchAgent is not None:
             try:
-                self.tools['tavily'] = TavilySearchAgent()
+                self.tools['tavily'] = TavilySearchAgent(session=session)
             except Exception:
                 self.tools['tavily'] = None
 
     def execute_queries(self, generated_queries: List[str], source_filters: List[str]) -> List[Dict[str, Any]]:
         results: List[Dict[str, Any]] = []
-        for q in generated_queries:
-            # Decide which tool(s) to use based on source_filters
-            if 'tavily' in self.tools and self.tools['tavily']:
-                snippets = self.tools['tavily'].search(q)
-                results.extend(self._normalize_snippets(snippets, q, source='tavily'))
-            else:
-                # Fallback to built-in mock results
-                results.extend(self._mock_results(q))
-
-            # Placeholder: if reddit requested, call reddit tool (not implemented)
-            if any('reddit' in s.lower() for s in source_filters):
-                results.extend(self._mock_reddit(q))
-
-            # Placeholder: if twitter/x requested, call twitter tool (not implemented)
-            if any(s.lower() in ('twitter', 'x') for s in source_filters):
-                results.extend(self._mock_twitter(q))
+        tavily = self.tools.get('tavily')
+
+        # Lowercase the filters once instead of re-scanning them per query
+        filters_lower = {s.lower() for s in source_filters}
+        want_reddit = any('reddit' in f for f in filters_lower)
+        want_twitter = 'twitter' in filters_lower or 'x' in filters_lower
+
+        # The Tavily calls are network-bound, so fan them out over a thread
+        # pool; ex.map preserves input order, keeping output deterministic.
+        if tavily and generated_queries:
+            with ThreadPoolExecutor(max_workers=min(16, len(generated_queries))) as ex:
+                snippets_per_query = list(ex.map(tavily.search, generated_queries))
+        else:
+            snippets_per_query = [None] * len(generated_queries)
+
+        for q, snippets in zip(generated_queries, snippets_per_query):
+            results.extend(self._assemble_query_results(q, snippets, want_reddit, want_twitter))
+
+        return results
+
+    async def execute_queries_async(self, generated_queries: List[str], source_filters: List[str],
+                                    max_parallel: int = 16) -> List[Dict[str, Any]]:
+        """Async variant of execute_queries: fan the blocking searches out
+        with asyncio.gather so wall time is bounded by the slowest query
+        rather than the sum of all of them.
+
+        Concurrency is capped by a semaphore, and a failing query is
+        dropped instead of sinking the whole batch.
+        """
+        tavily = self.tools.get('tavily')
+
+        filters_lower = {s.lower() for s in source_filters}
+        want_reddit = any('reddit' in f for f in filters_lower)
+        want_twitter = 'twitter' in filters_lower or 'x' in filters_lower
+
+        sem = asyncio.Semaphore(max_parallel)
+
+        async def _scrape_one(q: str) -> List[Dict[str, Any]]:
+            async with sem:
+                snippets = await asyncio.to_thread(tavily.search, q) if tavily else None
+            return self._assemble_query_results(q, snippets, want_reddit, want_twitter)
+
+        batches = await asyncio.gather(
+            *(_scrape_one(q) for q in generated_queries), return_exceptions=True
+        )
+        results: List[Dict[str, Any]] = []
+        for batch in batches:
+            if isinstance(batch, BaseException):
+                continue
+            results.extend(batch)
+        return results
+
+    def _assemble_query_results(self, q: str, snippets, want_reddit: bool,
+                                want_twitter: bool) -> List[Dict[str, Any]]:
+        # Shared per-query assembly for the sync and async paths
+        results: List[Dict[str, Any]] = []
+        if snippets is not None:
+            results.extend(self._normalize_snippets(snippets, q, source='tavily'))
+        else:
+            # Fallback to built-in mock results
+            results.extend(self._mock_results(q))
+
+        # Placeholder: if reddit requested, call reddit tool (not implemented)
+        if want_reddit:
+            results.extend(self._mock_reddit(q))
+
+        # Placeholder: if twitter/x requested, call twitter tool (not implemented)
+        if want_twitter:
+            results.extend(self._mock_twitter(q))
 
         return results
 
@@ -48,9 +113,10 @@ class Search_and_Retrieval_Agent:
         from datetime import datetime
 
         normalized = []
+        source = _intern.setdefault(source, source)
         for i, text in enumerate(snippets):
             normalized.append({
-                'text': text,
+                'text': _intern.setdefault(text, text),
                 'url': f'https://{source}.example/{query.replace(" ", "-")}/{i}',
                 'timestamp': datetime.utcnow().isoformat() + 'Z',
                 'source': source
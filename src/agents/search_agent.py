@@ -1,3 +1,39 @@
+import threading
+
+try:
+    import requests as _requests
+except Exception:  # requests is optional; the mock search path needs no HTTP
+    _requests = None
+
+# One shared Session so every TavilySearchAgent reuses the same connection
+# pool (keep-alive TCP/TLS) instead of handshaking per instantiation.
+_SESSION = _requests.Session() if _requests is not None else None
+
+# Base query templates, built once at import time and formatted per call.
+# Each entry is (template, requires_target_audience); order matters, since
+# generate_queries keeps the first max_queries unique results.
+_QUERY_TEMPLATES = (
+    # Generic
+    ("{subject} complaints", False),
+    ("{subject} complaints from {target_audience}", True),
+    ("{target_audience} frustrations with {subject}", True),
+    # Emotion / sentiment focused
+    ("frustrations about {subject}", False),
+    ("why people hate {subject}", False),
+    # Problem-focused / workflow bottlenecks
+    ("{subject} performance issues", False),
+    ("{subject} bottlenecks", False),
+    ("{subject} productivity problems", False),
+    # Tool and integration focused (helpful for technical domains)
+    ("{subject} integration problems", False),
+    ("{subject} data loss", False),
+    ("{subject} crash", False),
+    # Persona-driven prompts
+    ("{target_audience} problems with {subject}", True),
+    ("what {target_audience} hate about {subject}", True),
+)
+
+
 class Query_Generation_Agent:
     """Generates diverse search queries for a given subject and target audience.
 
@@ -7,71 +43,60 @@ class Query_Generation_Agent:
     - Returns a deduplicated list of queries ordered by heuristic priority
     """
 
+    __slots__ = ("max_queries",)
+
     def __init__(self, max_queries: int = 20):
         self.max_queries = max_queries
 
     def generate_queries(self, subject: str, target_audience: str = None, feedback_log: list | None = None) -> list:
         feedback_log = feedback_log or []
-        queries = []
-
-        # Generic queries
-        queries.append(f"{subject} complaints")
-        if target_audience:
-            queries.append(f"{subject} complaints from {target_audience}")
-            queries.append(f"{target_audience} frustrations with {subject}")
 
-        # Emotion / sentiment focused
-        queries.append(f"frustrations about {subject}")
-        queries.append(f"why people hate {subject}")
+        # Insertion-ordered dict keyed on the normalized form: dedupes as we
+        # generate and caps at max_queries, so we never materialize the old
+        # base + extra + dedup intermediate lists.
+        out: dict[str, str] = {}
+        max_queries = self.max_queries
 
-        # Problem-focused / workflow bottlenecks
-        queries.append(f"{subject} performance issues")
-        queries.append(f"{subject} bottlenecks")
-        queries.append(f"{subject} productivity problems")
+        def add(q: str):
+            if len(out) < max_queries:
+                key = q.lower().strip()
+                if key not in out:
+                    out[key] = q
 
-        # Tool and integration focused (helpful for technical domains)
-        queries.append(f"{subject} integration problems")
-        queries.append(f"{subject} data loss")
-        queries.append(f"{subject} crash" )
-
-        # Persona-driven prompts
-        if target_audience:
-            queries.append(f"{target_audience} problems with {subject}")
-            queries.append(f"what {target_audience} hate about {subject}")
+        # Base templates (hoisted to module scope), formatted per call.
+        # Each stage bails out as soon as the cap is hit — once `out` is
+        # full nothing further can be added, so the remaining formatting
+        # and expansion work would be pure waste.
+        for tmpl, needs_audience in _QUERY_TEMPLATES:
+            if len(out) >= max_queries:
+                return list(out.values())
+            if needs_audience and not target_audience:
+                continue
+            add(tmpl.format(subject=subject, target_audience=target_audience))
 
         # Incorporate feedback log to bias generation
         for fb in feedback_log:
+            if len(out) >= max_queries:
+                return list(out.values())
             # If feedback mentions a topic, focus queries on that topic
             fb_clean = str(fb).strip()
             if not fb_clean:
                 continue
-            queries.append(f"{subject} {fb_clean}")
-            queries.append(f"{subject} problems: {fb_clean}")
-
-        # Heuristic diversification: expand with short variants
-        extra = []
-        for q in list(queries):
-            extra.append(q + " issues")
-            extra.append(q + " complaints")
+            add(f"{subject} {fb_clean}")
+            add(f"{subject} problems: {fb_clean}")
+
+        # Heuristic diversification: expand kept queries with short variants
+        for q in list(out.values()):
+            if len(out) >= max_queries:
+                break
+            add(q + " issues")
+            add(q + " complaints")
             if " " in q:
                 # shorten multiword queries to last two tokens
                 tokens = q.split()
-                extra.append(" ".join(tokens[-2:]))
-
-        queries.extend(extra)
-
-        # Deduplicate while preserving order
-        seen = set()
-        deduped = []
-        for q in queries:
-            qn = q.lower().strip()
-            if qn not in seen:
-                seen.add(qn)
-                deduped.append(q)
-            if len(deduped) >= self.max_queries:
-                break
+                add(" ".join(tokens[-2:]))
 
-        return deduped
+        return list(out.values())
 
     def refine_queries(self, generated_queries: list, feedback_log: list | None = None) -> list:
         """Refine an existing list of queries using feedback from validators.
@@ -86,10 +111,18 @@ class Query_Generation_Agent:
         feedback_log = feedback_log or []
         refined = []
 
-        # If feedback asks for focus on bottlenecks or tools, transform queries
-        focus_tools = any("tool" in str(fb).lower() or "tool names" in str(fb).lower() for fb in feedback_log)
-        focus_bottlenecks = any("bottleneck" in str(fb).lower() or "bottlenecks" in str(fb).lower() for fb in feedback_log)
-        too_generic = any("generic" in str(fb).lower() or "too generic" in str(fb).lower() for fb in feedback_log)
+        # If feedback asks for focus on bottlenecks or tools, transform
+        # queries. Lowercase each entry once and set all flags in one pass
+        # instead of three independent scans.
+        focus_tools = focus_bottlenecks = too_generic = False
+        for fb in feedback_log:
+            fb_lower = str(fb).lower()
+            if "tool" in fb_lower:
+                focus_tools = True
+            if "bottleneck" in fb_lower:
+                focus_bottlenecks = True
+            if "generic" in fb_lower:
+                too_generic = True
 
         for q in generated_queries:
             base = q
@@ -125,6 +158,72 @@ class Query_Generation_Agent:
         return out
 
 
+class _SemanticQueryCache:
+    """Centroid-based semantic cache for search results.
+
+    The query generator emits many paraphrases ("complaints",
+    "frustrations", "problems with ..."); a query whose embedding lands
+    within `threshold` cosine similarity of an existing centroid reuses
+    that centroid's snippets instead of paying another API round trip.
+
+    Embeddings use sklearn's stateless HashingVectorizer (l2-normalized
+    sparse vectors), so no corpus fitting is needed. If sklearn is
+    unavailable the cache degrades to a no-op.
+    """
+
+    __slots__ = ("threshold", "_entries", "_vec")
+
+    def __init__(self, threshold: float = 0.86):
+        self.threshold = threshold
+        # entries: [vector, n_queries_merged, snippets]
+        self._entries = []
+        try:
+            from sklearn.feature_extraction.text import HashingVectorizer
+
+            self._vec = HashingVectorizer(n_features=2 ** 12, norm='l2',
+                                          alternate_sign=False)
+        except Exception:
+            self._vec = None
+
+    def _embed(self, query):
+        return self._vec.transform([query])
+
+    def _nearest(self, v):
+        best_i, best_sim = -1, 0.0
+        for i, (c, _, _) in enumerate(self._entries):
+            # Both vectors are unit-norm, so the dot product is the cosine
+            sim = float(v.multiply(c).sum())
+            if sim > best_sim:
+                best_i, best_sim = i, sim
+        return best_i, best_sim
+
+    def get(self, query):
+        if self._vec is None or not self._entries:
+            return None
+        i, sim = self._nearest(self._embed(query))
+        if sim >= self.threshold:
+            return list(self._entries[i][2])
+        return None
+
+    def put(self, query, snippets):
+        if self._vec is None:
+            return
+        v = self._embed(query)
+        i, sim = self._nearest(v)
+        if sim >= self.threshold:
+            # Fold the new query into the matched centroid (running mean,
+            # renormalized) and extend its snippet pool
+            c, n, cached = self._entries[i]
+            merged = (c * n + v) / (n + 1)
+            norm = (merged.multiply(merged)).sum() ** 0.5
+            if norm:
+                merged = merged / norm
+            cached.extend(s for s in snippets if s not in cached)
+            self._entries[i] = [merged, n + 1, cached]
+        else:
+            self._entries.append([v, 1, list(snippets)])
+
+
 class TavilySearchAgent:
     """Uses Tavily (a hypothetical web-search API) to execute semantic searches.
 
@@ -134,26 +233,54 @@ class TavilySearchAgent:
     - If no API key is configured, it falls back to a deterministic mock
       implementation (useful for tests and offline development).
     """
+
+    __slots__ = ("api_key", "timeout", "session", "_cache", "_cache_max",
+                 "_cache_lock", "_semantic_cache")
+
     def __init__(self, api_key=None, session=None, timeout=10):
-        # Lazy import to avoid hard dependency when not used
-        import os
         from src.utils.config import get_env
 
         self.api_key = api_key or get_env('TAVILY_API_KEY')
         self.timeout = timeout
-        self.session = session
-        if self.session is None:
-            try:
-                import requests
-                self.session = requests.Session()
-            except Exception:
-                self.session = None
+        # Default to the shared module-level session (connection pooling)
+        self.session = session if session is not None else _SESSION
+        # Exact-match result cache: the query generator emits many literal
+        # repeats across refinement rounds, each of which would cost an RTT.
+        # The lock guards the evict/insert sequence — execute_queries fans
+        # search() out over threads sharing this one agent.
+        self._cache = {}
+        self._cache_max = 512
+        self._cache_lock = threading.Lock()
+        # Second-level cache keyed on query meaning rather than exact text
+        self._semantic_cache = _SemanticQueryCache()
 
     def search(self, query, max_results=10):
+        key = (query, max_results)
+        cached = self._cache.get(key)
+        if cached is not None:
+            # Return a copy so callers can't mutate the cached list
+            return list(cached)
+        results = self._search_uncached(query, max_results)
+        # Evict/insert under the lock: two threads that both see a full
+        # cache must not pop the same first key (the loser would raise).
+        with self._cache_lock:
+            if len(self._cache) >= self._cache_max:
+                # Drop the oldest entry (dicts preserve insertion order)
+                self._cache.pop(next(iter(self._cache)), None)
+            self._cache[key] = results
+        return list(results)
+
+    def _search_uncached(self, query, max_results=10):
         if not self.api_key or not self.session:
             # Fallback deterministic mock
             return self._mock_search(query, max_results)
 
+        # Paraphrase hit? Reuse the semantically-matching centroid's
+        # snippets instead of issuing another API call.
+        cached = self._semantic_cache.get(query)
+        if cached is not None:
+            return cached[:max_results]
+
         # Call Tavily REST API (fictional endpoint used as example)
         url = 'https://api.tavily.com/v1/search'
         headers = {'Authorization': f'Bearer {self.api_key}'}
@@ -173,6 +300,7 @@ class TavilySearchAgent:
                 for item in data.get('results', []):
                     text = item.get('snippet') or item.get('text') or str(item)
                     results.append(text)
+                self._semantic_cache.put(query, results)
                 return results
             except Exception:
                 if attempt == attempts:
@@ -1,23 +1,99 @@
 """Workflow orchestrator with optional LangGraph integration.
 
 This module will try multiple import paths for LangGraph and, if available,
-build a graph-based workflow. If LangGraph isn't installed or the API doesn't
-match, it falls back to a simple sequential orchestrator that uses the
-project's agent classes directly. Either way `Workflow.run()` returns a
-dictionary with at least the key `pain_points` (so tests and callers stay
-stable).
+register the pipeline nodes on a LangGraph graph for introspection. Execution
+itself always goes through a DAG compiled once at construction time: each
+stage is resolved to a single bound coroutine up front and stages that share a
+topological level ("waves") are dispatched together with `asyncio.gather`.
+`Workflow.run()` returns a dictionary with at least the key `pain_points` (so
+tests and callers stay stable).
 """
-from typing import Any, Dict
+import asyncio
+import functools
+import hashlib
+import importlib
+import importlib.util
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Tuple
 
+try:
+    import orjson  # optional: much faster canonical encoding for fingerprints
+except Exception:
+    orjson = None
+
+try:
+    import requests as _requests
+except Exception:
+    _requests = None
+
+from src.utils.config import SCRAPING_TIMEOUT
 from src.agents.search_agent import Query_Generation_Agent
 from src.agents.scraper_agent import Search_and_Retrieval_Agent
 from src.agents.analyzer_agent import Validation_Agent
 from src.agents.aggregator_agent import Synthesis_Agent
 
 
+# Hoisted default so run() doesn't allocate fresh literals per invocation
+SOURCE_FILTERS_DEFAULT = ("social media", "forums")
+
+
+def _concat(old, new):
+    return old + new
+
+
+def _replace(old, new):
+    return new
+
+
+# Each node's declared output: (state key, merge reducer, empty factory).
+# Declaring the merge up front keeps fan-out deterministic — concurrent
+# outputs for the same key are folded by the reducer rather than clobbering
+# each other — and removes any runtime type inspection of node outputs.
+NODE_OUTPUTS = {
+    "query_generator": ("generated_queries", _concat, list),
+    "searcher": ("raw_results", _concat, list),
+    "validator": ("validated_pain_points", _concat, list),
+    "aggregator": ("report", _replace, str),
+}
+
+# The state keys each node actually reads — the basis for its cache
+# fingerprint, so unrelated state changes don't cause spurious misses.
+NODE_INPUTS = {
+    "query_generator": ("subject", "target_audience", "feedback_log"),
+    "searcher": ("generated_queries", "source_filters"),
+    "validator": ("raw_results",),
+    "aggregator": ("validated_pain_points",),
+}
+
+
+@dataclass(slots=True)
+class RunState:
+    """Per-run pipeline state.
+
+    Each run() call builds a fresh instance and threads it through the
+    scheduler, so a single Workflow can serve concurrent callers without
+    racing on shared mutable instance state.
+    """
+    subject: str
+    target_audience: str
+    feedback_log: List[str] = field(default_factory=list)
+    source_filters: Tuple[str, ...] = SOURCE_FILTERS_DEFAULT
+    generated_queries: List[str] = field(default_factory=list)
+    raw_results: List[Any] = field(default_factory=list)
+    validated_pain_points: List[Any] = field(default_factory=list)
+    report: str = ""
+
+
+@functools.lru_cache(maxsize=1)
 def _import_langgraph():
     """Try several possible langgraph import paths and return (GraphClass, NodeClass)
     or (None, None) if unavailable.
+
+    Memoized so the probe runs at most once per process — every Workflow
+    construction used to re-pay up to four failed imports. find_spec is
+    checked first because it reports a missing module by returning None
+    instead of raising (no exception/traceback construction).
     """
     candidates = [
         ("langgraph", "Graph", "Node"),
@@ -27,7 +103,12 @@ def _import_langgraph():
     ]
     for module_name, graph_name, node_name in candidates:
         try:
-            module = __import__(module_name, fromlist=[graph_name, node_name])
+            if importlib.util.find_spec(module_name) is None:
+                continue
+        except (ImportError, ValueError):
+            continue
+        try:
+            module = importlib.import_module(module_name)
             Graph = getattr(module, graph_name)
             Node = getattr(module, node_name)
             return Graph, Node
@@ -36,17 +117,82 @@ def _import_langgraph():
     return None, None
 
 
+@functools.lru_cache(maxsize=None)
+def _detect_node_ctor(NodeClass):
+    """Probe the Node constructor signature once per class and return a
+    factory using the working form.
+
+    LangGraph's Node signature doesn't change mid-process, so a single
+    throwaway probe replaces the old per-node nested try/except ladder
+    (three attempts x four nodes per Workflow construction).
+    """
+    def _probe_fn(state):
+        return state
+
+    try:
+        # Some versions allow Node(name, fn)
+        NodeClass("probe", _probe_fn)
+        return lambda name, fn: NodeClass(name, fn)
+    except Exception:
+        pass
+    try:
+        # Some versions accept Node(name=name, runnable=fn)
+        NodeClass(name="probe", runnable=_probe_fn)
+        return lambda name, fn: NodeClass(name=name, runnable=fn)
+    except Exception:
+        pass
+
+    # Last resort: instantiate Node(name) and attach the callable
+    def _fallback(name, fn):
+        n = NodeClass(name)
+        setattr(n, "callable", fn)
+        return n
+
+    return _fallback
+
+
 class Workflow:
-    def __init__(self, subject: str = "customer service", target_audience: str = "users"):
+    # Slots: attribute reads in the scheduler hot path become C-struct
+    # offsets instead of __dict__ lookups, and instances shrink accordingly
+    __slots__ = (
+        "subject", "target_audience", "max_parallel", "node_timeout",
+        "_enable_cache", "_node_cache", "_cache_epoch", "_http",
+        "query_agent", "search_agent", "validation_agent", "synthesis_agent",
+        "_compiled_dag", "graph", "_nodes", "_use_graph",
+    )
+
+    def __init__(self, subject: str = "customer service", target_audience: str = "users",
+                 enable_cache: bool = True, max_parallel: int = 8,
+                 node_timeout: float = SCRAPING_TIMEOUT):
         self.subject = subject
         self.target_audience = target_audience
+        # Scheduler bounds: at most max_parallel nodes in flight, and no
+        # node may run longer than node_timeout — a hung scrape yields its
+        # empty output instead of stalling the whole gather.
+        self.max_parallel = max_parallel
+        self.node_timeout = node_timeout
+        # Node-output cache keyed on a fingerprint of (node, its inputs):
+        # repeat runs with identical inputs become dict lookups instead of
+        # full scrape/validation passes. Bump the epoch (invalidate_cache)
+        # to force fresh results.
+        self._enable_cache = enable_cache
+        self._node_cache: Dict[str, Any] = {}
+        self._cache_epoch = 0
+        # One HTTP session owned by the workflow and shared by every search
+        # the agents make, so repeated hosts reuse pooled connections
+        # instead of re-handshaking per query.
+        self._http = _requests.Session() if _requests is not None else None
+
         # Prepare local agents
         self.query_agent = Query_Generation_Agent()
-        self.search_agent = Search_and_Retrieval_Agent()
+        self.search_agent = Search_and_Retrieval_Agent(session=self._http)
         self.validation_agent = Validation_Agent()
         self.synthesis_agent = Synthesis_Agent()
 
-        # Try to wire a LangGraph graph if available
+        # Compile the execution DAG once: no per-run node resolution
+        self._compile_dag()
+
+        # Try to register the nodes on a LangGraph graph if available
         Graph, Node = _import_langgraph()
         if Graph and Node:
             try:
@@ -58,120 +204,132 @@ class Workflow:
         else:
             self._use_graph = False
 
+    def _compile_dag(self):
+        """Resolve every pipeline stage to a bound coroutine, grouped into
+        topological "waves" whose members have no dependencies on each
+        other and can therefore be gathered concurrently.
+
+        This replaces the old reflective dispatch (``hasattr`` probes for
+        ``run``/``call``/``execute`` on every node of every request) with a
+        direct call through a reference resolved once at construction.
+        """
+        self._compiled_dag = [
+            [("query_generator", self._node_query)],
+            [("searcher", self._node_search)],
+            [("validator", self._node_validate)],
+            [("aggregator", self._node_synthesize)],
+        ]
+
+    async def _node_query(self, state: RunState):
+        return self.query_agent.generate_queries(
+            state.subject, state.target_audience, state.feedback_log
+        )
+
+    async def _node_search(self, state: RunState):
+        return await self.search_agent.execute_queries_async(
+            state.generated_queries, state.source_filters
+        )
+
+    async def _node_validate(self, state: RunState):
+        return self.validation_agent.validate_results(state.raw_results)
+
+    async def _node_synthesize(self, state: RunState):
+        return self.synthesis_agent.compile_report(state.validated_pain_points)
+
     def _use_langgraph(self, GraphClass: Any, NodeClass: Any):
-        """Construct a simple LangGraph graph using the available classes.
+        """Register the compiled pipeline on a LangGraph graph.
 
         The exact API varies between versions, so we attempt a conservative
-        wiring: create nodes that wrap the agent callables and add simple
-        edges. This is intentionally minimal because full LangGraph integration
-        should be implemented and tested with the target library version.
+        wiring. The graph is kept for introspection/visualization only —
+        execution always goes through the compiled DAG.
         """
         # Build a minimal graph instance
         self.graph = GraphClass()
 
-        # Helper to wrap an agent into a callable node. Different LangGraph
-        # releases may accept different node constructor params; try common ones.
-        def _make_node(name, agent_callable):
-            try:
-                # Some versions allow Node(name, fn)
-                return NodeClass(name, agent_callable)
-            except Exception:
-                try:
-                    # Some versions accept Node(name=name, runnable=fn)
-                    return NodeClass(name=name, runnable=agent_callable)
-                except Exception:
-                    # Last resort: just instantiate NodeClass(name)
-                    n = NodeClass(name)
-                    # attach the callable for our simple runner
-                    setattr(n, "callable", agent_callable)
-                    return n
-
-        # Create nodes for each agent
-        qn = _make_node("query_generator", lambda state: self.query_agent.generate_queries(
-            state.get("subject"), state.get("target_audience"), state.get("feedback_log", [])
-        ))
-        sn = _make_node("searcher", lambda state: self.search_agent.execute_queries(
-            state.get("generated_queries", []), state.get("source_filters", [])))
-        vn = _make_node("validator", lambda state: self.validation_agent.validate_results(
-            state.get("raw_results", [])))
-        an = _make_node("aggregator", lambda state: self.synthesis_agent.compile_report(
-            state.get("validated_pain_points", [])))
+        # Resolve the working Node constructor once (cached per class)
+        make_node = _detect_node_ctor(NodeClass)
+
+        # Create nodes mirroring the compiled DAG stages
+        nodes = [
+            make_node(name, fn)
+            for wave in self._compiled_dag
+            for name, fn in wave
+        ]
 
         # Add nodes to graph — API differences exist; try multiple ways
         try:
             # common API: graph.add_node(node)
-            self.graph.add_node(qn)
-            self.graph.add_node(sn)
-            self.graph.add_node(vn)
-            self.graph.add_node(an)
+            for n in nodes:
+                self.graph.add_node(n)
         except Exception:
             # Fallback: append to a nodes attribute if present
             if not hasattr(self.graph, "nodes"):
                 self.graph.nodes = []
-            self.graph.nodes.extend([qn, sn, vn, an])
+            self.graph.nodes.extend(nodes)
 
         # Store node refs for possible custom execution
-        self._nodes = [qn, sn, vn, an]
-
-    def run(self) -> Dict[str, Any]:
-        # Ensure state is populated with subject/targets
-        state = {
-            "subject": self.subject,
-            "target_audience": self.target_audience,
-            "feedback_log": [],
-            "source_filters": ["social media", "forums"],
-        }
-
-        if getattr(self, "_use_graph", False):
-            # Try to execute nodes using LangGraph if available. Because Node
-            # APIs differ, we support either a `callable` attribute or a
-            # `.run()` / `.call()` method on the node.
-            for node in getattr(self, "_nodes", []):
-                # Execute node using attached callable if present
-                if hasattr(node, "callable") and callable(getattr(node, "callable")):
-                    out = node.callable(state)
-                else:
-                    # Try common runtimes
-                    executed = False
-                    for name in ("run", "call", "execute"):
-                        if hasattr(node, name):
-                            fn = getattr(node, name)
-                            try:
-                                out = fn(state)
-                                executed = True
-                                break
-                            except Exception:
-                                continue
-                    if not executed:
-                        # As last resort, try calling the node itself
-                        try:
-                            out = node(state)
-                        except Exception:
-                            out = None
-
-                # integrate outputs into state using best-effort keys
-                if out is not None:
-                    # heuristics based on which node produced output
-                    if isinstance(out, list):
-                        # assume search outputs list -> raw_results
-                        if "raw_results" not in state or len(state.get("raw_results", [])) == 0:
-                            state["raw_results"] = out
-                        else:
-                            state["raw_results"].extend(out)
-                    elif isinstance(out, dict):
-                        state.update(out)
-                    else:
-                        # ignore scalar outputs for now
-                        pass
-
-            # After graph execution, validate and synthesize if not already done
-            validated = state.get("validated_pain_points") or self.validation_agent.validate_results(state.get("raw_results", []))
-            report = state.get("report") or self.synthesis_agent.compile_report(validated)
-            return {"pain_points": validated, "report": report}
-
-        # Local sequential fallback (keeps tests and simple usage working)
-        generated_queries = self.query_agent.generate_queries(self.subject, self.target_audience, [])
-        raw_results = self.search_agent.execute_queries(generated_queries, ["social media", "forums"])
-        validated = self.validation_agent.validate_results(raw_results)
-        report = self.synthesis_agent.compile_report(validated)
-        return {"pain_points": validated, "report": report}
\ No newline at end of file
+        self._nodes = nodes
+
+    def close(self):
+        """Release the shared HTTP session's pooled connections."""
+        if self._http is not None:
+            self._http.close()
+
+    def invalidate_cache(self):
+        """Invalidate all cached node outputs (e.g. after feedback arrives)."""
+        self._cache_epoch += 1
+
+    def _fingerprint(self, name: str, state: RunState) -> str:
+        inputs = {k: getattr(state, k) for k in NODE_INPUTS[name]}
+        record = (self._cache_epoch, name, inputs)
+        if orjson is not None:
+            payload = orjson.dumps(record, option=orjson.OPT_SORT_KEYS, default=str)
+        else:
+            payload = json.dumps(record, sort_keys=True, default=str).encode()
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+    async def _dispatch(self, name: str, fn, state: RunState,
+                        sem: asyncio.Semaphore):
+        key = self._fingerprint(name, state) if self._enable_cache else None
+        if key is not None and key in self._node_cache:
+            return self._node_cache[key]
+        try:
+            async with sem:
+                out = await asyncio.wait_for(fn(state), timeout=self.node_timeout)
+        except asyncio.TimeoutError:
+            # Timed-out nodes contribute their empty output so downstream
+            # reducers can proceed; the miss is not cached.
+            return NODE_OUTPUTS[name][2]()
+        if key is not None:
+            self._node_cache[key] = out
+        return out
+
+    def run(self, subject: str = None, target_audience: str = None) -> Dict[str, Any]:
+        # Thin sync wrapper so existing callers and tests keep a blocking run()
+        return asyncio.run(self._run_async(subject, target_audience))
+
+    async def _run_async(self, subject: str = None, target_audience: str = None) -> Dict[str, Any]:
+        """Execute the compiled DAG wave by wave over a fresh RunState.
+
+        All mutable run state lives on the local RunState, so concurrent
+        run() calls on one Workflow instance never race. Nodes within a
+        wave are dispatched together with asyncio.gather; the search stage
+        additionally fans out per query, bounding its wall time by the
+        slowest query rather than the sum over all queries.
+        """
+        state = RunState(
+            subject=subject if subject is not None else self.subject,
+            target_audience=target_audience if target_audience is not None else self.target_audience,
+        )
+
+        # The semaphore is created per run because each asyncio.run uses a
+        # fresh event loop and primitives must not outlive their loop.
+        sem = asyncio.Semaphore(self.max_parallel)
+
+        for wave in self._compiled_dag:
+            outs = await asyncio.gather(*(self._dispatch(name, fn, state, sem) for name, fn in wave))
+            for (name, _), out in zip(wave, outs):
+                key, reducer, _ = NODE_OUTPUTS[name]
+                setattr(state, key, reducer(getattr(state, key), out))
+
+        return {"pain_points": state.validated_pain_points, "report": state.report}
@@ -1,7 +1,40 @@
 # Configuration settings for the Pain-Point Mining application
 
-API_KEY = "your_api_key_here"
+import functools
+import os
+from dataclasses import dataclass
+
 DATA_VALIDATION_THRESHOLD = 0.8
 SCRAPING_TIMEOUT = 10  # seconds
 RESULTS_LIMIT = 100  # maximum number of results to retrieve
-LOGGING_LEVEL = "INFO"  # options: DEBUG, INFO, WARNING, ERROR, CRITICAL
\ No newline at end of file
+LOGGING_LEVEL = "INFO"  # options: DEBUG, INFO, WARNING, ERROR, CRITICAL
+
+
+def get_env(name, default=None):
+    # Read an optional setting (e.g. API keys) from the environment
+    return os.environ.get(name, default)
+
+
+@dataclass(frozen=True)
+class Settings:
+    # Secrets come from the environment only — never module constants
+    api_key: str = None
+    data_validation_threshold: float = DATA_VALIDATION_THRESHOLD
+    scraping_timeout: int = SCRAPING_TIMEOUT
+    results_limit: int = RESULTS_LIMIT
+    logging_level: str = LOGGING_LEVEL
+
+
+@functools.lru_cache(maxsize=1)
+def settings() -> Settings:
+    # Read the environment once per process; callers capture the returned
+    # singleton (one local load) instead of re-reading module attributes in
+    # hot loops. Call settings.cache_clear() to pick up rotated secrets.
+    return Settings(
+        api_key=get_env("PAINPOINT_API_KEY"),
+        data_validation_threshold=float(
+            get_env("PAINPOINT_VALIDATION_THRESHOLD", DATA_VALIDATION_THRESHOLD)),
+        scraping_timeout=int(get_env("PAINPOINT_SCRAPING_TIMEOUT", SCRAPING_TIMEOUT)),
+        results_limit=int(get_env("PAINPOINT_RESULTS_LIMIT", RESULTS_LIMIT)),
+        logging_level=get_env("PAINPOINT_LOGGING_LEVEL", LOGGING_LEVEL),
+    )
@@ -1,15 +1,39 @@
+import logging
+
+from src.utils.config import LOGGING_LEVEL
+
+# Single module-level logger configured once from the app's LOGGING_LEVEL
+_log = logging.getLogger("painpoint")
+_log.setLevel(LOGGING_LEVEL)
+if not _log.handlers:
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(logging.Formatter("[LOG] %(message)s"))
+    _log.addHandler(_handler)
+
+
 def format_data(data):
-    # Function to format data for consistency
+    # Function to format data for consistency. All-string input (sampled on
+    # a short prefix) takes map(str.strip, ...), which loops entirely in C
+    # and skips the redundant str() coercion per element.
+    try:
+        if all(type(x) is str for x in data[:8]):
+            return list(map(str.strip, data))
+    except TypeError:
+        # unsliceable input or a non-string past the sampled prefix
+        pass
     return [str(item).strip() for item in data]
 
-def log_message(message):
-    # Function to log messages to the console or a file
-    print(f"[LOG] {message}")
+def log_message(message, *args):
+    # Function to log messages to the console or a file. %-style args are
+    # interpolated lazily, so below-threshold messages cost nothing.
+    _log.info(message, *args)
 
 def extract_keywords(text):
     # Function to extract keywords from a given text
     # Placeholder for actual keyword extraction logic
-    return text.split()[:5]  # Example: return first 5 words as keywords
+    # maxsplit stops after the fifth split instead of tokenizing the
+    # whole document just to keep the first five words
+    return text.split(maxsplit=5)[:5]
 
 def validate_input(input_data):
     # Function to validate input data